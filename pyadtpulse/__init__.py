@@ -2,12 +2,12 @@
 
 import logging
 import asyncio
-import time
+import sys
+from concurrent.futures import Future
 from threading import RLock, Thread
 from warnings import warn
 
 import aiohttp_zlib_ng
-import uvloop
 
 from .const import (
     ADT_DEFAULT_HTTP_USER_AGENT,
@@ -21,11 +21,24 @@ from .util import DebugRLock, set_debug_lock
 aiohttp_zlib_ng.enable_zlib_ng()
 LOG = logging.getLogger(__name__)
 
+# uvloop isn't available on Windows
+if sys.platform == "win32":
+    new_event_loop = asyncio.new_event_loop
+else:
+    import uvloop
+
+    new_event_loop = uvloop.new_event_loop
+
 
 class PyADTPulse(PyADTPulseAsync):
     """Base object for ADT Pulse service."""
 
-    __slots__ = ("_session_thread", "_p_attribute_lock", "_login_exception")
+    __slots__ = (
+        "_session_thread",
+        "_p_attribute_lock",
+        "_login_done",
+        "_sync_logout_task",
+    )
 
     def __init__(
         self,
@@ -60,7 +73,8 @@ class PyADTPulse(PyADTPulseAsync):
             detailed_debug_logging,
         )
         self._session_thread: Thread | None = None
-        self._login_exception: Exception | None = None
+        self._login_done: Future[None] | None = None
+        self._sync_logout_task: asyncio.Task | None = None
         if do_login:
             self.login()
 
@@ -78,19 +92,23 @@ class PyADTPulse(PyADTPulseAsync):
         """
         Pulse the session thread.
 
-        Acquires the attribute lock and creates a background thread for the ADT
-        Pulse API. The thread runs the synchronous loop `_sync_loop()` until completion.
+        Creates an event loop for the ADT Pulse API in the background thread.
+        The thread runs the synchronous loop `_sync_loop()` until completion.
         Once the loop finishes, the thread is closed, the pulse connection's event loop
         is set to `None`, and the session thread is set to `None`.
         """
-        # lock is released in sync_loop()
-        self._p_attribute_lock.acquire()
-
         LOG.debug("Creating ADT Pulse background thread")
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-        loop = asyncio.new_event_loop()
+        loop = new_event_loop()
         self._pulse_connection_properties.loop = loop
-        loop.run_until_complete(self._sync_loop())
+        try:
+            loop.run_until_complete(self._sync_loop())
+        finally:
+            login_done = self._login_done
+            if login_done is not None and not login_done.done():
+                # don't leave login() waiting forever
+                login_done.set_exception(
+                    RuntimeError("ADT Pulse session thread exited during login")
+                )
 
         loop.close()
         self._pulse_connection_properties.loop = None
@@ -103,24 +121,26 @@ class PyADTPulse(PyADTPulseAsync):
 
         This function is responsible for executing the synchronization logic. It starts
         by calling the `async_login` method to perform the login operation. After that,
-        it releases the `_p_attribute_lock` to allow other tasks to access the
-        attributes.
+        it completes the `_login_done` future that `login()` is waiting on.
         If the login operation was successful, it waits for the `_timeout_task` to
         complete using the `asyncio.wait` function.  If the `_timeout_task` is not set,
         it raises a `RuntimeError` to indicate that background tasks were not created.
 
-        After the waiting process, it enters a while loop that continues as long as the
-        `_authenticated` event is set. Inside the loop, it waits for 0.5 seconds using
-        the `asyncio.sleep` function. This wait allows the logout process to complete
-        before continuing with the synchronization logic.
+        After the waiting process, if a logout is in progress it waits for the logout
+        task to complete so that the loop is not closed underneath it.
         """
+        self._sync_logout_task = None
+        login_done = self._login_done
+        if login_done is None:
+            raise RuntimeError("Sync session started without login")
+        # each login runs on a new event loop
+        self._reset_events()
         try:
             await self.async_login()
         except Exception as e:
-            self._login_exception = e
-        self._p_attribute_lock.release()
-        if self._login_exception is not None:
+            login_done.set_exception(e)
             return
+        login_done.set_result(None)
         if self._timeout_task is not None:
             task_list = (self._timeout_task,)
             try:
@@ -134,9 +154,10 @@ class PyADTPulse(PyADTPulseAsync):
         else:
             # we should never get here
             raise RuntimeError("Background pyadtpulse tasks not created")
-        while self._pulse_connection_status.authenticated_flag.is_set():
-            # busy wait until logout is done
-            await asyncio.sleep(0.5)
+        logout_task = self._sync_logout_task
+        if logout_task is not None:
+            # wait until logout is done
+            await asyncio.wait((logout_task,))
 
     def login(self) -> None:
         """Login to ADT Pulse and generate access token.
@@ -144,26 +165,23 @@ class PyADTPulse(PyADTPulseAsync):
         Raises:
             Exception from async_login
         """
-        self._p_attribute_lock.acquire()
-        # probably shouldn't be a daemon thread
-        self._session_thread = thread = Thread(
-            target=self._pulse_session_thread,
-            name="PyADTPulse Session",
-            daemon=True,
-        )
-        self._p_attribute_lock.release()
-
-        self._session_thread.start()
-        time.sleep(1)
-
-        # thread will unlock after async_login, so attempt to obtain
-        # lock to block current thread until then
-        # if it's still alive, no exception
-        self._p_attribute_lock.acquire()
-        self._p_attribute_lock.release()
-        if not thread.is_alive():
-            if self._login_exception is not None:
-                raise self._login_exception
+        with self._p_attribute_lock:
+            login_done: Future[None] = Future()
+            self._login_done = login_done
+            # probably shouldn't be a daemon thread
+            self._session_thread = thread = Thread(
+                target=self._pulse_session_thread,
+                name="PyADTPulse Session",
+                daemon=True,
+            )
+        thread.start()
+
+        # the session thread completes the future once async_login is done
+        try:
+            login_done.result()
+        except Exception:
+            thread.join()
+            raise
 
     def logout(self) -> None:
         """Log out of ADT Pulse."""
@@ -203,22 +221,32 @@ class PyADTPulse(PyADTPulseAsync):
         Returns:
             bool: True if updated data exists
         """
+        if self._sync_task is None:
+            loop = self._pulse_connection_properties.loop
+            if loop is None:
+                raise RuntimeError(
+                    "ADT pulse sync function updates_exist() "
+                    "called from async session"
+                )
+            # tasks can only be created safely from the loop's own thread
+            loop.call_soon_threadsafe(self._start_sync_check_task)
+        updates_exist = self._pulse_properties.updates_exist
+        if updates_exist.is_set():
+            updates_exist.clear()
+            return True
+        return False
+
+    def _start_sync_check_task(self) -> None:
+        """Start the sync check task if it isn't running.
+
+        Must be called from the session's event loop.
+        """
         with self._p_attribute_lock:
             if self._sync_task is None:
-                loop = self._pulse_connection_properties.loop
-                if loop is None:
-                    raise RuntimeError(
-                        "ADT pulse sync function updates_exist() "
-                        "called from async session"
-                    )
                 coro = self._sync_check_task()
-                self._sync_task = loop.create_task(
+                self._sync_task = asyncio.get_running_loop().create_task(
                     coro, name=f"{SYNC_CHECK_TASK_NAME}: Sync session"
                 )
-            if self._pulse_properties.updates_exist.is_set():
-                self._pulse_properties.updates_exist.clear()
-                return True
-            return False
 
     def update(self) -> bool:
         """Update ADT Pulse data.
@@ -244,6 +272,9 @@ class PyADTPulse(PyADTPulseAsync):
         self._pulse_connection_properties.check_async(
             "Cannot logout asynchronously with a synchronous session"
         )
+        current_task = asyncio.current_task()
+        if current_task not in (self._sync_task, self._timeout_task):
+            self._sync_logout_task = current_task
         await super().async_logout()
 
     async def async_update(self) -> bool:
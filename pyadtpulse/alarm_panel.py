@@ -2,17 +2,16 @@
 
 import logging
 import re
-from asyncio import run_coroutine_threadsafe
-from dataclasses import dataclass
-from threading import RLock
+from asyncio import get_running_loop, run_coroutine_threadsafe
+from dataclasses import dataclass, field
+from threading import Lock
 from time import time
 
 from lxml import html
-from typeguard import typechecked
 
 from .const import ADT_ARM_DISARM_URI
 from .pulse_connection import PulseConnection
-from .util import make_etree
+from .util import handle_response
 
 LOG = logging.getLogger(__name__)
 ADT_ALARM_AWAY = "away"
@@ -32,6 +31,7 @@ ALARM_STATUSES = (
     ADT_ALARM_DISARMING,
     ADT_ALARM_NIGHT,
 )
+ALARM_STATUS_SET = frozenset(ALARM_STATUSES)
 
 ALARM_POSSIBLE_STATUS_MAP = {
     "Disarmed": (ADT_ALARM_OFF, ADT_ALARM_ARMING),
@@ -42,6 +42,8 @@ ALARM_POSSIBLE_STATUS_MAP = {
 
 ADT_ARM_DISARM_TIMEOUT: float = 20
 
+SAT_PATTERN = re.compile(r"sat=([a-z0-9\-]+)")
+
 
 @dataclass(slots=True)
 class ADTPulseAlarmPanel:
@@ -53,8 +55,13 @@ class ADTPulseAlarmPanel:
     manufacturer: str = "ADT"
     online: bool = True
     _is_force_armed: bool = False
-    _state_lock = RLock()
-    _last_arm_disarm: int = int(time())
+    _state_lock: Lock = field(
+        default_factory=Lock, init=False, repr=False, compare=False
+    )
+    _last_arm_disarm: int = field(default_factory=lambda: int(time()))
+
+    # Getters read a single attribute, which is atomic, so they don't take
+    # _state_lock.  Writers still hold it so related fields change together.
 
     @property
     def status(self) -> str:
@@ -63,8 +70,7 @@ class ADTPulseAlarmPanel:
         Returns:
             str: the alarm status
         """
-        with self._state_lock:
-            return self._status
+        return self._status
 
     @status.setter
     def status(self, new_status: str) -> None:
@@ -73,9 +79,9 @@ class ADTPulseAlarmPanel:
         Args:
             new_status (str): the new alarm status
         """
+        if new_status not in ALARM_STATUS_SET:
+            raise ValueError(f"Alarm status must be one of {ALARM_STATUSES}")
         with self._state_lock:
-            if new_status not in ALARM_STATUSES:
-                raise ValueError(f"Alarm status must be one of {ALARM_STATUSES}")
             self._status = new_status
 
     @property
@@ -85,8 +91,7 @@ class ADTPulseAlarmPanel:
         Returns:
             bool: True if armed away
         """
-        with self._state_lock:
-            return self._status == ADT_ALARM_AWAY
+        return self._status == ADT_ALARM_AWAY
 
     @property
     def is_home(self) -> bool:
@@ -95,8 +100,7 @@ class ADTPulseAlarmPanel:
         Returns:
             bool: True if system is armed home/stay
         """
-        with self._state_lock:
-            return self._status == ADT_ALARM_HOME
+        return self._status == ADT_ALARM_HOME
 
     @property
     def is_disarmed(self) -> bool:
@@ -105,8 +109,7 @@ class ADTPulseAlarmPanel:
         Returns:
             bool: True if the system is disarmed
         """
-        with self._state_lock:
-            return self._status == ADT_ALARM_OFF
+        return self._status == ADT_ALARM_OFF
 
     @property
     def is_force_armed(self) -> bool:
@@ -115,8 +118,7 @@ class ADTPulseAlarmPanel:
         Returns:
             bool: True if system armed in bypass mode
         """
-        with self._state_lock:
-            return self._is_force_armed
+        return self._is_force_armed
 
     @property
     def is_arming(self) -> bool:
@@ -125,8 +127,7 @@ class ADTPulseAlarmPanel:
         Returns:
             bool: True if system is attempting to arm
         """
-        with self._state_lock:
-            return self._status == ADT_ALARM_ARMING
+        return self._status == ADT_ALARM_ARMING
 
     @property
     def is_disarming(self) -> bool:
@@ -135,8 +136,7 @@ class ADTPulseAlarmPanel:
         Returns:
             bool: True if system is attempting to disarm
         """
-        with self._state_lock:
-            return self._status == ADT_ALARM_DISARMING
+        return self._status == ADT_ALARM_DISARMING
 
     @property
     def is_armed_night(self) -> bool:
@@ -145,8 +145,7 @@ class ADTPulseAlarmPanel:
         Returns:
             bool: True if system is in night mode
         """
-        with self._state_lock:
-            return self._status == ADT_ALARM_NIGHT
+        return self._status == ADT_ALARM_NIGHT
 
     @property
     def last_update(self) -> float:
@@ -155,10 +154,8 @@ class ADTPulseAlarmPanel:
         Returns:
             float: last arm/disarm time
         """
-        with self._state_lock:
-            return self._last_arm_disarm
+        return self._last_arm_disarm
 
-    @typechecked
     async def _arm(
         self, connection: PulseConnection, mode: str, force_arm: bool
     ) -> bool:
@@ -172,82 +169,91 @@ class ADTPulseAlarmPanel:
             bool: True if operation successful
         """
         LOG.debug("Setting ADT alarm %s to %s, force = %s", self._sat, mode, force_arm)
+        # don't hold the (non-reentrant) lock across the query
         with self._state_lock:
-            if self._status == mode:
-                LOG.warning(
-                    "Attempting to set alarm status %s to existing status %s",
-                    mode,
-                    self._status,
-                )
-            if self._status != ADT_ALARM_OFF and mode != ADT_ALARM_OFF:
-                LOG.warning("Cannot set alarm status from %s to %s", self._status, mode)
-                return False
-            params = {
-                "href": "rest/adt/ui/client/security/setArmState",
-                "armstate": self._status,  # existing state
-                "arm": mode,  # new state
-                "sat": self._sat,
-            }
-            if force_arm and mode != ADT_ALARM_OFF:
-                params = {
-                    "href": "rest/adt/ui/client/security/setForceArm",
-                    "armstate": "forcearm",  # existing state
-                    "arm": mode,  # new state
-                    "sat": self._sat,
-                }
-
-            response = await connection.async_query(
-                ADT_ARM_DISARM_URI,
-                method="POST",
-                extra_params=params,
-                timeout=10,
+            status = self._status
+            sat = self._sat
+        if status == mode:
+            LOG.warning(
+                "Attempting to set alarm status %s to existing status %s",
+                mode,
+                status,
             )
+        if status != ADT_ALARM_OFF and mode != ADT_ALARM_OFF:
+            LOG.warning("Cannot set alarm status from %s to %s", status, mode)
+            return False
+        params = {
+            "href": "rest/adt/ui/client/security/setArmState",
+            "armstate": status,  # existing state
+            "arm": mode,  # new state
+            "sat": sat,
+        }
+        if force_arm and mode != ADT_ALARM_OFF:
+            params["href"] = "rest/adt/ui/client/security/setForceArm"
+            params["armstate"] = "forcearm"  # existing state
+
+        response = await connection.async_query(
+            ADT_ARM_DISARM_URI,
+            method="POST",
+            extra_params=params,
+            timeout=10,
+        )
 
-            tree = make_etree(
-                response[0],
-                response[1],
-                response[2],
-                logging.WARNING,
-                f"Failed updating ADT Pulse alarm {self._sat} to {mode}",
+        code, response_text, url = response
+        error_message = f"Failed updating ADT Pulse alarm {sat} to {mode}"
+        if not handle_response(code, url, logging.WARNING, error_message):
+            return False
+        if response_text is None:
+            LOG.warning("%s: no response received from %s", error_message, url)
+            return False
+
+        # only failed requests return the arm/disarm wrapper, don't parse otherwise
+        arm_result = None
+        if "p_armDisarmWrapper" in response_text:
+            arm_result = html.fromstring(response_text).find(
+                ".//div[@class='p_armDisarmWrapper']"
             )
-            if tree is None:
+        if arm_result is not None:
+            error_block = arm_result.find(".//div")
+            if error_block is not None:
+                error_text = arm_result.text_content().replace(
+                    "Arm AnywayCancel\n\n", ""
+                )
+                LOG.warning(
+                    "Could not set alarm state to %s because %s", mode, error_text
+                )
                 return False
-
-            arm_result = tree.find(".//div[@class='p_armDisarmWrapper']")
-            if arm_result is not None:
-                error_block = arm_result.find(".//div")
-                if error_block is not None:
-                    error_text = arm_result.text_content().replace(
-                        "Arm AnywayCancel\n\n", ""
-                    )
-                    LOG.warning(
-                        "Could not set alarm state to %s because %s", mode, error_text
-                    )
-                    return False
-        self._is_force_armed = force_arm
-        if mode == ADT_ALARM_OFF:
-            self._status = ADT_ALARM_DISARMING
-        else:
-            self._status = ADT_ALARM_ARMING
-        self._last_arm_disarm = int(time())
+        with self._state_lock:
+            self._is_force_armed = force_arm
+            if mode == ADT_ALARM_OFF:
+                self._status = ADT_ALARM_DISARMING
+            else:
+                self._status = ADT_ALARM_ARMING
+            self._last_arm_disarm = int(time())
         return True
 
-    @typechecked
     def _sync_set_alarm_mode(
         self,
         connection: PulseConnection,
         mode: str,
         force_arm: bool = False,
     ) -> bool:
+        loop = connection.check_sync(
+            "Attempting to sync change alarm mode from async session"
+        )
+        try:
+            get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # blocking on .result() from inside a loop would deadlock
+            raise RuntimeError(
+                "Attempting to sync change alarm mode from a running event loop, "
+                "use the async_arm/async_disarm methods instead"
+            )
         coro = self._arm(connection, mode, force_arm)
-        return run_coroutine_threadsafe(
-            coro,
-            connection.check_sync(
-                "Attempting to sync change alarm mode from async session"
-            ),
-        ).result()
-
-    @typechecked
+        return run_coroutine_threadsafe(coro, loop).result()
+
     def arm_away(self, connection: PulseConnection, force_arm: bool = False) -> bool:
         """Arm the alarm in Away mode.
 
@@ -259,7 +265,6 @@ class ADTPulseAlarmPanel:
         """
         return self._sync_set_alarm_mode(connection, ADT_ALARM_AWAY, force_arm)
 
-    @typechecked
     def arm_night(self, connection: PulseConnection, force_arm: bool = False) -> bool:
         """Arm the alarm in Night mode.
 
@@ -271,7 +276,6 @@ class ADTPulseAlarmPanel:
         """
         return self._sync_set_alarm_mode(connection, ADT_ALARM_NIGHT, force_arm)
 
-    @typechecked
     def arm_home(self, connection: PulseConnection, force_arm: bool = False) -> bool:
         """Arm the alarm in Home mode.
 
@@ -283,7 +287,6 @@ class ADTPulseAlarmPanel:
         """
         return self._sync_set_alarm_mode(connection, ADT_ALARM_HOME, force_arm)
 
-    @typechecked
     def disarm(self, connection: PulseConnection) -> bool:
         """Disarm the alarm.
 
@@ -292,7 +295,6 @@ class ADTPulseAlarmPanel:
         """
         return self._sync_set_alarm_mode(connection, ADT_ALARM_OFF, False)
 
-    @typechecked
     async def async_arm_away(
         self, connection: PulseConnection, force_arm: bool = False
     ) -> bool:
@@ -306,7 +308,6 @@ class ADTPulseAlarmPanel:
         """
         return await self._arm(connection, ADT_ALARM_AWAY, force_arm)
 
-    @typechecked
     async def async_arm_home(
         self, connection: PulseConnection, force_arm: bool = False
     ) -> bool:
@@ -319,7 +320,6 @@ class ADTPulseAlarmPanel:
         """
         return await self._arm(connection, ADT_ALARM_HOME, force_arm)
 
-    @typechecked
     async def async_arm_night(
         self, connection: PulseConnection, force_arm: bool = False
     ) -> bool:
@@ -332,7 +332,6 @@ class ADTPulseAlarmPanel:
         """
         return await self._arm(connection, ADT_ALARM_NIGHT, force_arm)
 
-    @typechecked
     async def async_disarm(self, connection: PulseConnection) -> bool:
         """Disarm alarm async.
 
@@ -341,7 +340,6 @@ class ADTPulseAlarmPanel:
         """
         return await self._arm(connection, ADT_ALARM_OFF, False)
 
-    @typechecked
     def update_alarm_from_etree(self, summary_html_etree: html.HtmlElement) -> None:
         """
         Updates the alarm status based on the information extracted from the provided
@@ -356,39 +354,43 @@ class ADTPulseAlarmPanel:
         LOG.debug("Updating alarm status")
         value = summary_html_etree.find(".//span[@class='p_boldNormalTextLarge']")
         sat_location = "security_button_0"
+        text = ""
+        if value is not None:
+            text = value.text_content().lstrip().partition("\n")[0]
         with self._state_lock:
             status_found = False
             last_updated = int(time())
-            if value is not None:
-                text = value.text_content().lstrip().splitlines()[0]
-
-                for (
-                    current_status,
-                    possible_statuses,
-                ) in ALARM_POSSIBLE_STATUS_MAP.items():
-                    if text.startswith(current_status):
-                        status_found = True
-                        if (
-                            self._status != possible_statuses[1]
-                            or last_updated - self._last_arm_disarm
-                            > ADT_ARM_DISARM_TIMEOUT
-                        ):
-                            self._status = possible_statuses[0]
-                            self._last_arm_disarm = last_updated
-                        break
-
-            if value is None or not status_found:
+            status = self._status
+            last_arm_disarm = self._last_arm_disarm
+            for (
+                current_status,
+                possible_statuses,
+            ) in ALARM_POSSIBLE_STATUS_MAP.items():
+                if text.startswith(current_status):
+                    status_found = True
+                    if (
+                        status != possible_statuses[1]
+                        or last_updated - last_arm_disarm > ADT_ARM_DISARM_TIMEOUT
+                    ):
+                        status = possible_statuses[0]
+                        last_arm_disarm = last_updated
+                    break
+
+            if not status_found:
                 if not text.startswith("Status Unavailable"):
                     LOG.warning("Failed to get alarm status from '%s'", text)
-                self._status = ADT_ALARM_UNKNOWN
-                self._last_arm_disarm = last_updated
+                status = ADT_ALARM_UNKNOWN
+                last_arm_disarm = last_updated
+            self._status = status
+            self._last_arm_disarm = last_arm_disarm
+            if not status_found:
                 return
-            LOG.debug("Alarm status = %s", self._status)
+            LOG.debug("Alarm status = %s", status)
             sat_string = f'.//input[@id="{sat_location}"]'
             sat_button = summary_html_etree.find(sat_string)
             if sat_button is not None and "onclick" in sat_button.attrib:
                 on_click = sat_button.attrib["onclick"]
-                match = re.search(r"sat=([a-z0-9\-]+)", on_click)
+                match = SAT_PATTERN.search(on_click)
                 if match:
                     self._sat = match.group(1)
             if not self._sat:
@@ -396,7 +398,6 @@ class ADTPulseAlarmPanel:
             else:
                 LOG.debug("Extracted sat = %s", self._sat)
 
-    @typechecked
     def set_alarm_attributes(self, alarm_attributes: dict[str, str]) -> None:
         """
         Set alarm attributes including model, manufacturer, and online status.
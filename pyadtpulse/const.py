@@ -32,6 +32,11 @@ ADT_GATEWAY_STRING = "gateway"
 ADT_DEFAULT_POLL_INTERVAL = 2.0
 ADT_GATEWAY_MAX_OFFLINE_POLL_INTERVAL = 600.0
 ADT_MAX_BACKOFF: float = 5.0 * 60.0
+# all traffic goes to a single host, so keep a small pool of long lived
+# connections and cache its DNS lookup
+ADT_HTTP_LIMIT_PER_HOST = 4
+ADT_HTTP_KEEPALIVE_TIMEOUT: float = 120.0
+ADT_HTTP_DNS_CACHE_TTL = 600
 ADT_DEFAULT_HTTP_USER_AGENT = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -54,12 +59,14 @@ ADT_DEFAULT_SEC_FETCH_HEADERS = {
 ADT_OTHER_HTTP_ACCEPT_HEADERS = {
     "Accept": "*/*",
 }
+ADT_ORB_HTTP_HEADERS = {"Sec-Fetch-Mode": "cors", "Sec-Fetch-Dest": "empty"}
+ADT_SYNC_CHECK_HTTP_HEADERS = {"Sec-Fetch-Mode": "iframe"}
 ADT_ARM_URI = "/quickcontrol/serv/RunRRACommand"
 ADT_ARM_DISARM_URI = "/quickcontrol/armDisarm.jsp"
 
 ADT_SYSTEM_SETTINGS = "/system/settings.jsp"
 
-ADT_HTTP_BACKGROUND_URIS = (ADT_ORB_URI, ADT_SYNC_CHECK_URI)
+ADT_HTTP_BACKGROUND_URIS = frozenset((ADT_ORB_URI, ADT_SYNC_CHECK_URI))
 STATE_OK = "OK"
 STATE_OPEN = "Open"
 STATE_MOTION = "Motion"
@@ -2,9 +2,12 @@
 
 import logging
 import re
-from dataclasses import dataclass
-from ipaddress import IPv4Address, IPv6Address, ip_address
-from threading import RLock
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv6Address
+from threading import Lock
 from typing import Any
 
 from typeguard import typechecked
@@ -31,6 +34,8 @@ STRING_UPDATEABLE_FIELDS = (
 
 DATETIME_UPDATEABLE_FIELDS = ("next_update", "last_update")
 
+MAC_ADDRESS_PATTERN = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
+
 IPADDR_UPDATEABLE_FIELDS = (
     "broadband_lan_ip_address",
     "device_lan_ip_address",
@@ -39,16 +44,57 @@ IPADDR_UPDATEABLE_FIELDS = (
 )
 
 
+@lru_cache(maxsize=16)
+def _parse_ip_address(value: str) -> IPv4Address | IPv6Address | None:
+    # gateway addresses are almost always IPv4, try that first
+    try:
+        return IPv4Address(value)
+    except ValueError:
+        pass
+    try:
+        return IPv6Address(value)
+    except ValueError:
+        return None
+
+
+def _parse_timestamp(value: str) -> int | None:
+    # "Today"/"Yesterday" are relative, so results are only valid for one day
+    return _parse_timestamp_on(value, date.today())
+
+
+@lru_cache(maxsize=16)
+def _parse_timestamp_on(value: str, day: date) -> int | None:
+    try:
+        return int(parse_pulse_datetime(value).timestamp())
+    except ValueError:
+        return None
+
+
+# field name -> parser for the raw string, None means store the string as is
+GATEWAY_FIELD_PARSERS: dict[str, Callable[[str], Any] | None] = {
+    **dict.fromkeys(STRING_UPDATEABLE_FIELDS),
+    **dict.fromkeys(IPADDR_UPDATEABLE_FIELDS, _parse_ip_address),
+    **dict.fromkeys(DATETIME_UPDATEABLE_FIELDS, _parse_timestamp),
+}
+
+
 @dataclass(slots=True)
 class ADTPulseGateway:
     """ADT Pulse Gateway information."""
 
     manufacturer: str = "Unknown"
-    _status_text: str = "OFFLINE"
-    backoff = PulseBackoff(
-        "Gateway", ADT_DEFAULT_POLL_INTERVAL, ADT_GATEWAY_MAX_OFFLINE_POLL_INTERVAL
+    _is_online: bool = False
+    backoff: PulseBackoff = field(
+        default_factory=lambda: PulseBackoff(
+            "Gateway", ADT_DEFAULT_POLL_INTERVAL, ADT_GATEWAY_MAX_OFFLINE_POLL_INTERVAL
+        ),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _attribute_lock: Lock = field(
+        default_factory=Lock, init=False, repr=False, compare=False
     )
-    _attribute_lock = RLock()
     model: str | None = None
     serial_number: str | None = None
     next_update: int = 0
@@ -73,56 +119,49 @@ class ADTPulseGateway:
         Returns:
             bool: True if gateway is online
         """
-        with self._attribute_lock:
-            return self._status_text == "ONLINE"
+        # single attribute read, no lock needed
+        return self._is_online
 
     @is_online.setter
-    @typechecked
     def is_online(self, status: bool) -> None:
         """Set gateway status.
 
         Args:
             status (bool): True if gateway is online
         """
+        status = bool(status)
         with self._attribute_lock:
-            if status == self.is_online:
+            if status == self._is_online:
                 return
-            old_status = self._status_text
-            self._status_text = "ONLINE"
-            if not status:
-                self._status_text = "OFFLINE"
-
-            LOG.info(
-                "ADT Pulse gateway %s",
-                self._status_text,
-            )
-            if old_status == "OFFLINE":
+            self._is_online = status
+
+            LOG.info("ADT Pulse gateway %s", "ONLINE" if status else "OFFLINE")
+            if status:
                 self.backoff.reset_backoff()
-            LOG.debug(
-                "Gateway poll interval: %d",
-                (
-                    self.backoff.initial_backoff_interval
-                    if self._status_text == "ONLINE"
-                    else self.backoff.get_current_backoff_interval()
-                ),
-            )
+            if LOG.isEnabledFor(logging.DEBUG):
+                # interval lookup takes the backoff lock, skip it if not logging
+                LOG.debug(
+                    "Gateway poll interval: %d",
+                    (
+                        self.backoff.initial_backoff_interval
+                        if status
+                        else self.backoff.get_current_backoff_interval()
+                    ),
+                )
 
     @property
     def poll_interval(self) -> float:
         """Get initial poll interval."""
-        with self._attribute_lock:
-            return self.backoff.initial_backoff_interval
+        return self.backoff.initial_backoff_interval
 
     @poll_interval.setter
-    @typechecked
     def poll_interval(self, new_interval: float) -> None:
         with self._attribute_lock:
             self.backoff.initial_backoff_interval = new_interval
 
     @staticmethod
     def _check_mac_address(mac_address: str) -> bool:
-        pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-        return re.match(pattern, mac_address) is not None
+        return MAC_ADDRESS_PATTERN.match(mac_address) is not None
 
     @property
     def broadband_lan_mac(self) -> str | None:
@@ -130,7 +169,6 @@ class ADTPulseGateway:
         return self._broadband_lan_mac
 
     @broadband_lan_mac.setter
-    @typechecked
     def broadband_lan_mac(self, new_mac: str | None) -> None:
         """Set gateway MAC address."""
         if new_mac is not None and not self._check_mac_address(new_mac):
@@ -143,7 +181,6 @@ class ADTPulseGateway:
         return self._device_lan_mac
 
     @device_lan_mac.setter
-    @typechecked
     def device_lan_mac(self, new_mac: str | None) -> None:
         """Set gateway MAC address."""
         if new_mac is not None and not self._check_mac_address(new_mac):
@@ -171,26 +208,13 @@ class ADTPulseGateway:
         Args:
             gateway_attributes (dict[str,str]): dictionary of gateway attributes
         """
-        for i in (
-            STRING_UPDATEABLE_FIELDS
-            + IPADDR_UPDATEABLE_FIELDS
-            + DATETIME_UPDATEABLE_FIELDS
-        ):
-            temp: Any = gateway_attributes.get(i)
-            if temp == "":
+        for name, parser in GATEWAY_FIELD_PARSERS.items():
+            temp: Any = gateway_attributes.get(name)
+            if not temp:
+                # missing or empty
                 temp = None
-            if temp is None:
-                setattr(self, i, None)
-                continue
-            if i in IPADDR_UPDATEABLE_FIELDS:
-                try:
-                    temp = ip_address(temp)
-                except ValueError:
-                    temp = None
-            elif i in DATETIME_UPDATEABLE_FIELDS:
-                try:
-                    temp = int(parse_pulse_datetime(temp).timestamp())
-                except ValueError:
-                    temp = None
-            if hasattr(self, i):
-                setattr(self, i, temp)
+            elif parser is not None:
+                temp = parser(temp)
+            # skip the validating setters when nothing changed
+            if getattr(self, name) != temp:
+                setattr(self, name, temp)
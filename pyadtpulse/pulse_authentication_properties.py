@@ -1,11 +1,13 @@
 """Pulse Authentication Properties."""
 
-from re import match
+from re import compile as re_compile
 
 from typeguard import typechecked
 
 from .util import set_debug_lock
 
+EMAIL_PATTERN = re_compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
 
 class PulseAuthenticationProperties:
     """Pulse Authentication Properties."""
@@ -26,8 +28,7 @@ class PulseAuthenticationProperties:
         Raises ValueError if a login parameter is not valid."""
         if not username:
             raise ValueError("Username is mandatory")
-        pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        if not match(pattern, username):
+        if not EMAIL_PATTERN.match(username):
             raise ValueError("Username must be an email address")
 
     @staticmethod
@@ -71,11 +72,12 @@ class PulseAuthenticationProperties:
         self._last_login_time = 0
         self._site_id = ""
 
+    # getters read a single attribute and don't need the lock
+
     @property
     def last_login_time(self) -> int:
         """Get the last login time."""
-        with self._paa_attribute_lock:
-            return self._last_login_time
+        return self._last_login_time
 
     @last_login_time.setter
     @typechecked
@@ -86,8 +88,7 @@ class PulseAuthenticationProperties:
     @property
     def username(self) -> str:
         """Get the username."""
-        with self._paa_attribute_lock:
-            return self._username
+        return self._username
 
     @username.setter
     @typechecked
@@ -99,8 +100,7 @@ class PulseAuthenticationProperties:
     @property
     def password(self) -> str:
         """Get the password."""
-        with self._paa_attribute_lock:
-            return self._password
+        return self._password
 
     @password.setter
     @typechecked
@@ -112,8 +112,7 @@ class PulseAuthenticationProperties:
     @property
     def fingerprint(self) -> str:
         """Get the fingerprint."""
-        with self._paa_attribute_lock:
-            return self._fingerprint
+        return self._fingerprint
 
     @fingerprint.setter
     @typechecked
@@ -125,8 +124,7 @@ class PulseAuthenticationProperties:
     @property
     def site_id(self) -> str:
         """Get the site ID."""
-        with self._paa_attribute_lock:
-            return self._site_id
+        return self._site_id
 
     @site_id.setter
     @typechecked
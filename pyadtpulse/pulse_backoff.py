@@ -3,6 +3,7 @@
 import asyncio
 import datetime
 from logging import getLogger
+from random import uniform
 from time import time
 
 from typeguard import typechecked
@@ -25,6 +26,8 @@ class PulseBackoff:
         "_name",
         "_detailed_debug_logging",
         "_threshold",
+        "_jitter",
+        "_current_interval",
     )
 
     @typechecked
@@ -36,6 +39,7 @@ class PulseBackoff:
         threshold: int = 0,
         debug_locks: bool = False,
         detailed_debug_logging=False,
+        jitter: bool = False,
     ) -> None:
         """Initialize backoff.
 
@@ -48,8 +52,12 @@ class PulseBackoff:
             debug_locks (bool, optional): Enable debug locks. Defaults to False.
             detailed_debug_logging (bool, optional): Enable detailed debug logging.
                 Defaults to False.
+            jitter (bool, optional): Randomize count based waits between 0 and the
+                backoff interval ("full jitter"). Defaults to False.
         """
         self._check_intervals(initial_backoff_interval, max_backoff_interval)
+        # the gateway poll_interval setter can change a backoff from a sync
+        # caller's thread while the event loop reads it, so always lock
         self._b_lock = set_debug_lock(debug_locks, "pyadtpulse._b_lock")
         self._initial_backoff_interval = initial_backoff_interval
         self._max_backoff_interval = max_backoff_interval
@@ -58,6 +66,9 @@ class PulseBackoff:
         self._name = name
         self._detailed_debug_logging = detailed_debug_logging
         self._threshold = threshold
+        self._jitter = jitter
+        # cached _calculate_backoff_interval(), refreshed on every state change
+        self._current_interval = 0.0
 
     def _calculate_backoff_interval(self) -> float:
         """Calculate backoff time."""
@@ -65,9 +76,11 @@ class PulseBackoff:
             return 0.0
         if self._backoff_count <= (self._threshold + 1):
             return self._initial_backoff_interval
+        # cap the exponent, anything this large is clamped to the max anyway
+        # and an uncapped one overflows the float multiply
+        exponent = min(self._backoff_count - self._threshold - 1, 64)
         return min(
-            self._initial_backoff_interval
-            * 2 ** (self._backoff_count - self._threshold - 1),
+            self._initial_backoff_interval * 2**exponent,
             self._max_backoff_interval,
         )
 
@@ -85,12 +98,13 @@ class PulseBackoff:
     def get_current_backoff_interval(self) -> float:
         """Return current backoff time."""
         with self._b_lock:
-            return self._calculate_backoff_interval()
+            return self._current_interval
 
     def increment_backoff(self) -> None:
         """Increment backoff."""
         with self._b_lock:
             self._backoff_count += 1
+            self._current_interval = self._calculate_backoff_interval()
             if self._detailed_debug_logging:
                 LOG.debug(
                     "Pulse backoff %s: incremented to %s",
@@ -106,8 +120,8 @@ class PulseBackoff:
                     LOG.debug("Pulse backoff %s reset", self._name)
                 self._backoff_count = 0
                 self._expiration_time = 0.0
+                self._current_interval = 0.0
 
-    @typechecked
     def set_absolute_backoff_time(self, backoff_time: float) -> None:
         """Set absolute backoff time."""
         curr_time = time()
@@ -124,21 +138,25 @@ class PulseBackoff:
                 )
             self._expiration_time = backoff_time
             self._backoff_count = 0
+            self._current_interval = 0.0
 
     async def wait_for_backoff(self) -> None:
         """Wait for backoff."""
+        # compute the wait under the lock, but never hold it across the sleep
         with self._b_lock:
             curr_time = time()
             if self._expiration_time < curr_time:
-                if self.backoff_count == 0:
+                if self._backoff_count == 0:
                     return
-                diff = self._calculate_backoff_interval()
+                diff = self._current_interval
+                if self._jitter:
+                    diff = uniform(0.0, diff)
             else:
                 diff = self._expiration_time - curr_time
-            if diff > 0:
-                if self._detailed_debug_logging:
-                    LOG.debug("Backoff %s: waiting for %s", self._name, diff)
-                await asyncio.sleep(diff)
+        if diff > 0:
+            if self._detailed_debug_logging:
+                LOG.debug("Backoff %s: waiting for %s", self._name, diff)
+            await asyncio.sleep(diff)
 
     def will_backoff(self) -> bool:
         """Return if backoff is needed."""
@@ -166,12 +184,12 @@ class PulseBackoff:
             return self._initial_backoff_interval
 
     @initial_backoff_interval.setter
-    @typechecked
     def initial_backoff_interval(self, new_interval: float) -> None:
         """Set initial backoff interval."""
         with self._b_lock:
             self._check_intervals(new_interval, self._max_backoff_interval)
             self._initial_backoff_interval = new_interval
+            self._current_interval = self._calculate_backoff_interval()
 
     @property
     def name(self) -> str:
@@ -185,7 +203,6 @@ class PulseBackoff:
             return self._detailed_debug_logging
 
     @detailed_debug_logging.setter
-    @typechecked
     def detailed_debug_logging(self, new_value: bool) -> None:
         """Set detailed debug logging."""
         with self._b_lock:
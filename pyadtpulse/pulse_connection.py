@@ -40,6 +40,26 @@ LOG = logging.getLogger(__name__)
 
 SESSION_COOKIES = {"X-mobile-browser": "false", "ICLocal": "en_US"}
 
+RETRY_DIGITS_PATTERN = re.compile(r"\d+")
+
+
+def extract_seconds_from_string(s: str) -> int:
+    """Extract the lockout time from a "Try again in N minutes" message.
+
+    Args:
+        s (str): the error text
+
+    Returns:
+        int: the lockout time in seconds, 0 if none was found
+    """
+    seconds = 0
+    match = RETRY_DIGITS_PATTERN.search(s)
+    if match:
+        seconds = int(match.group())
+        if "minute" in s.lower():
+            seconds *= 60
+    return seconds
+
 
 class PulseConnection(PulseQueryManager):
     """ADT Pulse connection related attributes."""
@@ -82,7 +102,6 @@ class PulseConnection(PulseQueryManager):
         self._login_in_progress = False
         self._debug_locks = debug_locks
 
-    @typechecked
     def check_login_errors(
         self, response: tuple[int, str | None, URL | None]
     ) -> html.HtmlElement:
@@ -104,15 +123,6 @@ class PulseConnection(PulseQueryManager):
             PulseNotLoggedInError: if login fails due to not logged in
         """
 
-        def extract_seconds_from_string(s: str) -> int:
-            seconds = 0
-            match = re.search(r"\d+", s)
-            if match:
-                seconds = int(match.group())
-                if "minutes" in s:
-                    seconds *= 60
-            return seconds
-
         def determine_error_type():
             """Determine what type of error we have from the url and the parsed page.
 
@@ -170,7 +180,6 @@ class PulseConnection(PulseQueryManager):
             raise PulseAuthenticationError()
         return tree
 
-    @typechecked
     async def async_do_login_query(
         self, timeout: int = ADT_DEFAULT_LOGIN_TIMEOUT
     ) -> html.HtmlElement | None:
@@ -269,6 +278,8 @@ class PulseConnection(PulseQueryManager):
             PulseServerConnectionError,
         ) as e:
             LOG.debug("Could not logout from Pulse site: %s", e)
+        # close the pooled connections, a new session is created on next login
+        await self._connection_properties.clear_session()
 
     @property
     def is_connected(self) -> bool:
@@ -300,7 +311,6 @@ class PulseConnection(PulseQueryManager):
             return self._login_in_progress
 
     @login_in_progress.setter
-    @typechecked
     def login_in_progress(self, value: bool) -> None:
         """Set login in progress."""
         with self._pc_attribute_lock:
@@ -325,7 +335,6 @@ class PulseConnection(PulseQueryManager):
         )
 
     @detailed_debug_logging.setter
-    @typechecked
     def detailed_debug_logging(self, value: bool):
         with self._pc_attribute_lock:
             self._login_backoff.detailed_debug_logging = value
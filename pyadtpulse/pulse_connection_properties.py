@@ -1,21 +1,26 @@
 """Pulse connection info."""
 
-from asyncio import AbstractEventLoop
-from re import search
+from asyncio import AbstractEventLoop, get_running_loop
+from re import compile as re_compile
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from typeguard import typechecked
 
 from .const import (
     ADT_DEFAULT_HTTP_ACCEPT_HEADERS,
     ADT_DEFAULT_HTTP_USER_AGENT,
     ADT_DEFAULT_SEC_FETCH_HEADERS,
+    ADT_HTTP_DNS_CACHE_TTL,
+    ADT_HTTP_KEEPALIVE_TIMEOUT,
+    ADT_HTTP_LIMIT_PER_HOST,
     API_HOST_CA,
     API_PREFIX,
     DEFAULT_API_HOST,
 )
 from .util import set_debug_lock
 
+API_VERSION_PATTERN = re_compile(f"{API_PREFIX}(.+)/[a-z]*/")
+
 
 class PulseConnectionProperties:
     """Pulse connection info."""
@@ -29,6 +34,7 @@ class PulseConnectionProperties:
         "_pci_attribute_lock",
         "_detailed_debug_logging",
         "_debug_locks",
+        "_url_cache",
     )
 
     @staticmethod
@@ -51,7 +57,7 @@ class PulseConnectionProperties:
         version: str | None = None
         if not response_path:
             return None
-        m = search(f"{API_PREFIX}(.+)/[a-z]*/", response_path)
+        m = API_VERSION_PATTERN.search(response_path)
         if m is not None:
             version = m.group(1)
         return version
@@ -71,6 +77,8 @@ class PulseConnectionProperties:
         self.detailed_debug_logging = detailed_debug_logging
         self._loop: AbstractEventLoop | None = None
         self._session: ClientSession | None = None
+        # uri -> url, only valid for the current host and API version
+        self._url_cache: dict[str, str] = {}
         self.service_host = host
         self._api_version = ""
         self._user_agent = user_agent
@@ -80,12 +88,6 @@ class PulseConnectionProperties:
         if self._session is not None and not self._session.closed:
             self._session.detach()
 
-    def _set_headers(self) -> None:
-        if self._session is not None:
-            self._session.headers.update(ADT_DEFAULT_HTTP_ACCEPT_HEADERS)
-            self._session.headers.update(ADT_DEFAULT_SEC_FETCH_HEADERS)
-            self._session.headers.update({"User-Agent": self._user_agent})
-
     @property
     def service_host(self) -> str:
         """Get the service host."""
@@ -103,6 +105,7 @@ class PulseConnectionProperties:
         self.check_service_host(host)
         with self._pci_attribute_lock:
             self._api_host = host
+            self._url_cache.clear()
 
     @property
     def detailed_debug_logging(self) -> bool:
@@ -146,10 +149,18 @@ class PulseConnectionProperties:
     def check_async(self, message: str) -> None:
         """Checks if async login was performed.
 
+        Calls made from the sync session's own event loop are allowed.
+
         Raises RuntimeError with given message if not.
         """
         with self._pci_attribute_lock:
-            if self._loop is not None:
+            if self._loop is None:
+                return
+            try:
+                running_loop = get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if self._loop is not running_loop:
                 raise RuntimeError(message)
 
     @property
@@ -170,15 +181,26 @@ class PulseConnectionProperties:
         """Get the session."""
         with self._pci_attribute_lock:
             if self._session is None:
-                self._session = ClientSession()
-            self._set_headers()
+                self._session = ClientSession(
+                    connector=TCPConnector(
+                        limit_per_host=ADT_HTTP_LIMIT_PER_HOST,
+                        keepalive_timeout=ADT_HTTP_KEEPALIVE_TIMEOUT,
+                        ttl_dns_cache=ADT_HTTP_DNS_CACHE_TTL,
+                    ),
+                    # default headers are fixed for the life of the session
+                    headers={
+                        **ADT_DEFAULT_HTTP_ACCEPT_HEADERS,
+                        **ADT_DEFAULT_SEC_FETCH_HEADERS,
+                        "User-Agent": self._user_agent,
+                    },
+                )
             return self._session
 
     @property
     def api_version(self) -> str:
         """Get the API version."""
-        with self._pci_attribute_lock:
-            return self._api_version
+        # single attribute read, no lock needed
+        return self._api_version
 
     @api_version.setter
     @typechecked
@@ -214,6 +236,8 @@ class PulseConnectionProperties:
 
         with self._pci_attribute_lock:
             check_version_string(version)
+            if version != self._api_version:
+                self._url_cache.clear()
             self._api_version = version
 
     @typechecked
@@ -226,8 +250,13 @@ class PulseConnectionProperties:
         Returns:
             str: the converted string
         """
+        url = self._url_cache.get(uri)
+        if url is not None:
+            return url
         with self._pci_attribute_lock:
-            return f"{self._api_host}{API_PREFIX}{self._api_version}{uri}"
+            url = f"{self._api_host}{API_PREFIX}{self._api_version}{uri}"
+            self._url_cache[uri] = url
+            return url
 
     async def clear_session(self):
         """Clear the session."""
@@ -42,6 +42,14 @@ class PulseConnectionStatus:
         with self._pcs_attribute_lock:
             return self._authenticated_flag
 
+    def reset_authenticated_flag(self) -> None:
+        """Replace the authenticated flag with a new, unset event.
+
+        Must be called from the event loop that will use the flag.
+        """
+        with self._pcs_attribute_lock:
+            self._authenticated_flag = Event()
+
     @property
     def retry_after(self) -> float:
         """Get the number of seconds to wait before retrying HTTP requests."""
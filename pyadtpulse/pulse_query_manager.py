@@ -1,7 +1,7 @@
 """Pulse Query Manager."""
 
 from logging import getLogger
-from asyncio import wait_for
+from asyncio import to_thread, wait_for
 from datetime import datetime
 from http import HTTPStatus
 from time import time
@@ -11,7 +11,6 @@ from aiohttp import (
     ClientConnectorError,
     ClientError,
     ClientResponse,
-    ClientResponseError,
     ServerConnectionError,
     ServerDisconnectedError,
     ServerTimeoutError,
@@ -23,6 +22,7 @@ from yarl import URL
 from .const import (
     ADT_DEFAULT_LOGIN_TIMEOUT,
     ADT_HTTP_BACKGROUND_URIS,
+    ADT_ORB_HTTP_HEADERS,
     ADT_ORB_URI,
     ADT_OTHER_HTTP_ACCEPT_HEADERS,
 )
@@ -39,7 +39,9 @@ from .util import make_etree, set_debug_lock
 
 LOG = getLogger(__name__)
 
+# transient errors worth retrying, other 4xx/5xx errors fail immediately
 RECOVERABLE_ERRORS = {
+    HTTPStatus.REQUEST_TIMEOUT,
     HTTPStatus.INTERNAL_SERVER_ERROR,
     HTTPStatus.BAD_GATEWAY,
     HTTPStatus.GATEWAY_TIMEOUT,
@@ -235,7 +237,8 @@ class PulseQueryManager:
             )
         await setup_query()
         url = self._connection_properties.make_url(uri)
-        headers = extra_headers if extra_headers is not None else {}
+        # per request copy, never mutate the caller's headers
+        headers = dict(extra_headers) if extra_headers else {}
         if uri in ADT_HTTP_BACKGROUND_URIS:
             headers.setdefault("Accept", ADT_OTHER_HTTP_ACCEPT_HEADERS["Accept"])
         if self._connection_properties.detailed_debug_logging:
@@ -259,6 +262,7 @@ class PulseQueryManager:
             threshold=0,
             debug_locks=self._debug_locks,
             detailed_debug_logging=self._connection_properties.detailed_debug_logging,
+            jitter=True,
         )
         max_retries = (
             MAX_REQUERY_RETRIES
@@ -296,33 +300,31 @@ class PulseQueryManager:
                 async with self._connection_properties.session.request(
                     method,
                     url,
-                    headers=extra_headers,
+                    headers=headers,
                     params=extra_params if method == "GET" else None,
                     data=extra_params if method == "POST" else None,
                     timeout=timeout,
                 ) as response:
                     return_value = await self._handle_query_response(response)
-                    if return_value[0] in RECOVERABLE_ERRORS:
-                        LOG.debug(
-                            "query returned recoverable error code %s: %s,"
-                            "retrying (count = %d)",
-                            return_value[0],
-                            self._get_http_status_description(return_value[0]),
-                            retry,
-                        )
-                        if max_retries > 1 and retry == max_retries:
-                            LOG.debug(
-                                "Exceeded max retries of %d, giving up", max_retries
-                            )
-                        else:
-                            query_backoff.increment_backoff()
-                            response.raise_for_status()
-                        continue
-                    response.raise_for_status()
-                    break
-
-            except ClientResponseError:
-                self._handle_http_errors(return_value)
+                # branch on the status directly rather than raising and catching
+                # ClientResponseError
+                if return_value[0] in RECOVERABLE_ERRORS:
+                    LOG.debug(
+                        "query returned recoverable error code %s: %s,"
+                        "retrying (count = %d)",
+                        return_value[0],
+                        self._get_http_status_description(return_value[0]),
+                        retry,
+                    )
+                    if retry == max_retries:
+                        LOG.debug("Exceeded max retries of %d, giving up", max_retries)
+                        self._handle_http_errors(return_value)
+                    query_backoff.increment_backoff()
+                    continue
+                if return_value[0] >= HTTPStatus.BAD_REQUEST:
+                    self._handle_http_errors(return_value)
+                break
+
             except (
                 ClientConnectorError,
                 ServerTimeoutError,
@@ -354,6 +356,18 @@ class PulseQueryManager:
         self._connection_status.get_backoff().reset_backoff()
         return (return_value[0], return_value[1], return_value[2])
 
+    async def async_fetch_orb(self) -> tuple[int, str | None, URL | None]:
+        """Fetch the ADT Pulse ORB without parsing it.
+
+        Returns:
+            tuple with integer return code, optional response text, and optional URL of
+            response
+
+        Raises:
+            same exceptions as query_orb
+        """
+        return await self.async_query(ADT_ORB_URI, extra_headers=ADT_ORB_HTTP_HEADERS)
+
     async def query_orb(
         self, level: int, error_message: str
     ) -> html.HtmlElement | None:
@@ -371,12 +385,27 @@ class PulseQueryManager:
             PulseServerConnectionError: If there is a server error
             PulseServiceTemporarilyUnavailableError: If the server returns a Retry-After header
         """
-        code, response, url = await self.async_query(
-            ADT_ORB_URI,
-            extra_headers={"Sec-Fetch-Mode": "cors", "Sec-Fetch-Dest": "empty"},
-        )
+        code, response, url = await self.async_fetch_orb()
+        return await self.async_parse_orb(code, response, url, level, error_message)
+
+    @staticmethod
+    async def async_parse_orb(
+        code: int, response: str | None, url: URL | None, level: int, error_message: str
+    ) -> html.HtmlElement | None:
+        """Parse an ADT Pulse ORB fetched with async_fetch_orb.
+
+        Args:
+            code (int): the response code
+            response (str | None): the response text
+            url (URL | None): the response url
+            level (int): error level to log on failure
+            error_message (str): error message to use on failure
 
-        return make_etree(code, response, url, level, error_message)
+        Returns:
+            Optional[html.HtmlElement]: the parsed response tree
+        """
+        # parse off the event loop, the orb page is polled on every update
+        return await to_thread(make_etree, code, response, url, level, error_message)
 
     async def async_fetch_version(self) -> None:
         """Fetch ADT Pulse version.
@@ -399,16 +428,6 @@ class PulseQueryManager:
                 signin_url, timeout=10
             ) as response:
                 response_values = await self._handle_query_response(response)
-                response.raise_for_status()
-
-        except ClientResponseError as ex:
-            LOG.error(
-                "Error %s occurred determining Pulse API version",
-                ex.args,
-                exc_info=True,
-            )
-            self._handle_http_errors(response_values)
-            return
         except (
             ClientConnectorError,
             ServerTimeoutError,
@@ -431,6 +450,11 @@ class PulseQueryManager:
                 "Timeout occurred determining Pulse API version",
                 self._connection_status.get_backoff(),
             ) from ex
+        if response_values[0] >= HTTPStatus.BAD_REQUEST:
+            LOG.error(
+                "Error %s occurred determining Pulse API version", response_values[0]
+            )
+            self._handle_http_errors(response_values)
         version = self._connection_properties.get_api_version(str(response_values[2]))
         if version is not None:
             self._connection_properties.api_version = version
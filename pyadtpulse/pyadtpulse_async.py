@@ -4,6 +4,8 @@ import logging
 import asyncio
 import re
 import time
+from datetime import date
+from hashlib import blake2b
 from random import randint
 from warnings import warn
 
@@ -17,6 +19,7 @@ from .const import (
     ADT_DEFAULT_KEEPALIVE_INTERVAL,
     ADT_DEFAULT_RELOGIN_INTERVAL,
     ADT_GATEWAY_STRING,
+    ADT_SYNC_CHECK_HTTP_HEADERS,
     ADT_SYNC_CHECK_URI,
     ADT_TIMEOUT_URI,
     DEFAULT_API_HOST,
@@ -45,6 +48,7 @@ KEEPALIVE_TASK_NAME = "ADT Pulse Keepalive Task"
 # backoff time before warning in wait_for_update()
 WARN_TRANSIENT_FAILURE_THRESHOLD = 2
 FULL_LOGOUT_INTERVAL = 6 * 60 * 60
+NETWORK_ID_PATTERN = re.compile(r"networkid=(.+)&")
 
 
 class PyADTPulseAsync:
@@ -181,8 +185,8 @@ class PyADTPulseAsync:
             if temp is not None:
                 signout_link = str(temp.get("href"))
             if signout_link:
-                m = re.search("networkid=(.+)&", signout_link)
-                if m and m.group(1) and m.group(1):
+                m = NETWORK_ID_PATTERN.search(signout_link)
+                if m and m.group(1):
                     site_id = m.group(1)
                     LOG.debug("Discovered site id %s: %s", site_id, site_name)
                     new_site = ADTPulseSite(self._pulse_connection, site_id, site_name)
@@ -256,10 +260,10 @@ class PyADTPulseAsync:
             if self.site.gateway.next_update < time.time():
                 await self.site.set_device(ADT_GATEWAY_STRING)
 
-        def should_relogin(relogin_interval: int) -> bool:
+        def should_relogin(relogin_interval: int, now: float) -> bool:
             return (
                 relogin_interval != 0
-                and time.time() - self._authentication_properties.last_login_time
+                and now - self._authentication_properties.last_login_time
                 > randint(int(0.75 * relogin_interval), relogin_interval)
             )
 
@@ -274,8 +278,9 @@ class PyADTPulseAsync:
             relogin_interval = self._pulse_properties.relogin_interval * 60
             try:
                 await asyncio.sleep(self._pulse_properties.keepalive_interval * 60)
+                now = time.time()
                 if (
-                    self._pulse_connection_status.retry_after > time.time()
+                    self._pulse_connection_status.retry_after > now
                     or self._pulse_connection_status.get_backoff().backoff_count
                     > WARN_TRANSIENT_FAILURE_THRESHOLD
                 ):
@@ -286,9 +291,9 @@ class PyADTPulseAsync:
                 if not self._pulse_connection.is_connected:
                     LOG.debug("%s: Skipping relogin because not connected", task_name)
                     continue
-                if should_relogin(relogin_interval):
+                if should_relogin(relogin_interval, now):
                     msg = "quick"
-                    if time.time() > next_full_logout_time:
+                    if now > next_full_logout_time:
                         msg = "full"
                     with self._pa_attribute_lock:
                         if self._sync_task:
@@ -341,6 +346,15 @@ class PyADTPulseAsync:
                 LOG.debug("%s cancelled", task_name)
                 return
 
+    def _reset_events(self) -> None:
+        """Create the session's asyncio events on the running event loop.
+
+        An asyncio.Event binds to the first loop that waits on it, so events
+        from a previous session's loop can't be reused.
+        """
+        self._pulse_connection_status.reset_authenticated_flag()
+        self._pulse_properties.reset_updates_exist()
+
     async def _clean_done_tasks(self) -> None:
         with self._pa_attribute_lock:
             if self._sync_task is not None and self._sync_task.done():
@@ -420,7 +434,7 @@ class PyADTPulseAsync:
         async def perform_sync_check_query():
             return await self._pulse_connection.async_query(
                 ADT_SYNC_CHECK_URI,
-                extra_headers={"Sec-Fetch-Mode": "iframe"},
+                extra_headers=ADT_SYNC_CHECK_HTTP_HEADERS,
                 extra_params={"ts": str(int(time.time() * 1000))},
             )
 
@@ -447,8 +461,14 @@ class PyADTPulseAsync:
             if response_text is None:
                 LOG.warning("Internal Error: response_text is None")
                 return False
-            pattern = r"\d+[-]\d+[-]\d+"
-            if not re.match(pattern, response_text):
+            # sync tokens are of the form N-N-N, check that without a regex
+            split_text = response_text.split("-", 2)
+            if not (
+                len(split_text) == 3
+                and split_text[0].isdecimal()
+                and split_text[1].isdecimal()
+                and split_text[2][:1].isdecimal()
+            ):
                 warning_msg = "Unexpected sync check format"
                 try:
                     self._pulse_connection.check_login_errors(
@@ -462,7 +482,6 @@ class PyADTPulseAsync:
                 finally:
                     LOG.warning(warning_msg)
                 return False
-            split_text = response_text.split("-")
             if int(split_text[0]) > 9 or int(split_text[1]) > 9:
                 return False
             return True
@@ -606,6 +625,9 @@ class PyADTPulseAsync:
         if self._pulse_connection.login_in_progress:
             LOG.debug("Login already in progress, returning")
             return
+        if self._timeout_task is None:
+            # new session, possibly on a new event loop
+            self._reset_events()
         LOG.debug(
             "Authenticating to ADT Pulse cloud service as %s",
             self._authentication_properties.username,
@@ -667,11 +689,35 @@ class PyADTPulseAsync:
         LOG.debug("Checking ADT Pulse cloud service for updates")
 
         # FIXME will have to query other URIs for camera/zwave/etc
-        tree = await self._pulse_connection.query_orb(
-            logging.INFO, "Error returned from ADT Pulse service check"
+        code, response, url = await self._pulse_connection.async_fetch_orb()
+        digest: tuple[bytes, date] | None = None
+        if response is not None:
+            # zone timestamps are relative to today, so include the date
+            digest = (
+                blake2b(response.encode(), digest_size=16).digest(),
+                date.today(),
+            )
+            site = self._site
+            if (
+                site is not None
+                and digest == site.orb_digest
+                and site.gateway.is_online
+                and not site.alarm_control_panel.is_arming
+                and not site.alarm_control_panel.is_disarming
+            ):
+                LOG.debug("ADT Pulse orb unchanged, skipping update")
+                return True
+        tree = await self._pulse_connection.async_parse_orb(
+            code,
+            response,
+            url,
+            logging.INFO,
+            "Error returned from ADT Pulse service check",
         )
         if tree is not None:
             await self._update_site(tree)
+            # _update_site always leaves a site or raises
+            self.site.orb_digest = digest
             return True
 
         return False
@@ -60,9 +60,8 @@ class PyADTPulseProperties:
             an instance of PulseAuthenticationProperties
         pulse_connection_properties (PulseConnectionProperties):
         """
-        # FIXME use thread event/condition, regular condition?
-        # defer initialization to make sure we have an event loop
-
+        # replaced by reset_updates_exist() when a session starts, since an
+        # asyncio.Event binds to the first loop that waits on it
         self._updates_exist = asyncio.locks.Event()
 
         self._pp_attribute_lock = set_debug_lock(
@@ -164,10 +163,18 @@ class PyADTPulseProperties:
     def set_update_status(self) -> None:
         """Sets updates_exist to notify wait_for_update."""
         with self._pp_attribute_lock:
-            self.updates_exist.set()
+            self._updates_exist.set()
 
     @property
     def updates_exist(self) -> asyncio.locks.Event:
         """Check if updates exist."""
         with self._pp_attribute_lock:
             return self._updates_exist
+
+    def reset_updates_exist(self) -> None:
+        """Replace updates_exist with a new, unset event.
+
+        Must be called from the event loop that will use the event.
+        """
+        with self._pp_attribute_lock:
+            self._updates_exist = asyncio.locks.Event()
@@ -3,7 +3,7 @@
 import logging
 import re
 from asyncio import Task, create_task, gather, get_event_loop, run_coroutine_threadsafe
-from datetime import datetime
+from datetime import date, datetime
 from time import time
 
 from lxml import html
@@ -25,12 +25,18 @@ LOG = logging.getLogger(__name__)
 
 SECURITY_PANEL_ID = "1"
 SECURITY_PANEL_NAME = "Security Panel"
+DEVICE_ID_PATTERN = re.compile(r"goToUrl\('device.jsp\?id=(\d*)'\);")
 
 
 class ADTPulseSite(ADTPulseSiteProperties):
     """Represents an individual ADT Pulse site."""
 
-    __slots__ = ("_pulse_connection", "_trouble_zones", "_tripped_zones")
+    __slots__ = (
+        "_pulse_connection",
+        "_trouble_zones",
+        "_tripped_zones",
+        "_orb_digest",
+    )
 
     @typechecked
     def __init__(self, pulse_connection: PulseConnection, site_id: str, name: str):
@@ -45,6 +51,23 @@ class ADTPulseSite(ADTPulseSiteProperties):
         super().__init__(site_id, name, pulse_connection.debug_locks)
         self._trouble_zones: set[int] | None = None
         self._tripped_zones: set[int] = set()
+        # digest of the last orb applied to the site and the day it was applied
+        self._orb_digest: tuple[bytes, date] | None = None
+
+    @property
+    def orb_digest(self) -> tuple[bytes, date] | None:
+        """Get the digest of the orb the site was last updated from.
+
+        None if the site was updated from an orb without a recorded digest.
+        """
+        with self._site_lock:
+            return self._orb_digest
+
+    @orb_digest.setter
+    def orb_digest(self, digest: tuple[bytes, date] | None) -> None:
+        """Set the digest of the orb the site was last updated from."""
+        with self._site_lock:
+            self._orb_digest = digest
 
     @typechecked
     def arm_home(self, force_arm: bool = False) -> bool:
@@ -185,7 +208,6 @@ class ADTPulseSite(ADTPulseSiteProperties):
             bool: True if the devices were fetched and zone attributes were updated
                 successfully, False otherwise.
         """
-        regex_device = r"goToUrl\('device.jsp\?id=(\d*)'\);"
         task_list: list[Task] = []
         zone_id: str | None = None
 
@@ -225,12 +247,11 @@ class ADTPulseSite(ADTPulseSiteProperties):
             return zone_id
 
         def check_panel_or_gateway(
-            regex_device: str,
             device_name: str,
             zone_id: str | None,
             on_click_value_text: str,
         ) -> Task | None:
-            result = re.findall(regex_device, on_click_value_text)
+            result = DEVICE_ID_PATTERN.findall(on_click_value_text)
             if result:
                 device_id = result[0]
                 if device_id == SECURITY_PANEL_ID or device_name == SECURITY_PANEL_NAME:
@@ -275,7 +296,6 @@ class ADTPulseSite(ADTPulseSiteProperties):
                     task_list.append(create_task(self.set_device(ADT_GATEWAY_STRING)))
                 elif (
                     result := check_panel_or_gateway(
-                        regex_device,
                         device_name,
                         zone_id,
                         on_click_value_text,
@@ -337,6 +357,8 @@ class ADTPulseSite(ADTPulseSiteProperties):
         Raises:
             PulseGatewayOffline: If the gateway is offline.
         """
+        # site state no longer necessarily matches the last recorded orb
+        self.orb_digest = None
 
         def get_zone_id(zone_row: html.HtmlElement) -> int | None:
             try:
@@ -877,3 +877,37 @@ async def test_absolute_backoff_time(mock_sleep, freeze_time_to_now):
     await backoff.wait_for_backoff()
     assert mock_sleep.call_count == 1
     assert mock_sleep.call_args_list[0][0][0] == 100
+
+
+@pytest.mark.asyncio
+async def test_wait_for_backoff_with_jitter(mocker, mock_sleep):
+    """
+    Test that a jittered backoff waits between 0 and the backoff interval.
+    """
+    backoff = PulseBackoff("test_backoff", 1.0, 10.0, jitter=True)
+    mock_uniform = mocker.patch("pyadtpulse.pulse_backoff.uniform", return_value=0.25)
+    await backoff.wait_for_backoff()
+    assert mock_sleep.call_count == 0
+    backoff.increment_backoff()
+    backoff.increment_backoff()
+    await backoff.wait_for_backoff()
+    mock_uniform.assert_called_once_with(0.0, 2.0)
+    assert mock_sleep.await_args[0][0] == 0.25
+
+
+def test_current_backoff_interval_tracks_state():
+    """
+    Test that the cached backoff interval follows increments, resets and a
+    backoff count large enough to overflow an uncapped exponent.
+    """
+    backoff = PulseBackoff("test_backoff", 1.0, 10.0)
+    assert backoff.get_current_backoff_interval() == 0.0
+    backoff.increment_backoff()
+    backoff.increment_backoff()
+    assert backoff.get_current_backoff_interval() == 2.0
+    backoff.initial_backoff_interval = 3.0
+    assert backoff.get_current_backoff_interval() == 6.0
+    backoff.reset_backoff()
+    assert backoff.get_current_backoff_interval() == 0.0
+    backoff._backoff_count = 2000
+    assert backoff._calculate_backoff_interval() == 10.0
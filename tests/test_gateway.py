@@ -17,7 +17,7 @@ def test_default_values():
     """
     gateway = ADTPulseGateway()
     assert gateway.manufacturer == "Unknown"
-    assert gateway._status_text == "OFFLINE"
+    assert gateway._is_online is False
     assert gateway.backoff._name == "Gateway"
     assert gateway.backoff._initial_backoff_interval == ADT_DEFAULT_POLL_INTERVAL
     assert (
@@ -133,7 +133,7 @@ def test_default_values2():
     """
     gateway = ADTPulseGateway()
     assert gateway.manufacturer == "Unknown"
-    assert gateway._status_text == "OFFLINE"
+    assert gateway._is_online is False
     assert gateway.backoff.name == "Gateway"
     assert gateway.backoff.initial_backoff_interval == ADT_DEFAULT_POLL_INTERVAL
     assert (
@@ -304,12 +304,12 @@ def test_is_online_property_true_and_false():
     # Test setting is_online to True
     gateway.is_online = True
     assert gateway.is_online == True
-    assert gateway._status_text == "ONLINE"
+    assert gateway._is_online is True
 
     # Test setting is_online to False
     gateway.is_online = False
     assert gateway.is_online == False
-    assert gateway._status_text == "OFFLINE"
+    assert gateway._is_online is False
 
 
 # poll_interval property can be set to a custom value
@@ -330,7 +330,7 @@ def test_custom_values():
     """
     gateway = ADTPulseGateway(
         manufacturer="Custom Manufacturer",
-        _status_text="CUSTOM_STATUS",
+        _is_online=True,
         model="Custom Model",
         serial_number="Custom Serial Number",
         next_update=1234567890,
@@ -350,7 +350,7 @@ def test_custom_values():
     )
 
     assert gateway.manufacturer == "Custom Manufacturer"
-    assert gateway._status_text == "CUSTOM_STATUS"
+    assert gateway.is_online is True
     assert gateway.backoff._name == "Gateway"
     assert gateway.backoff._initial_backoff_interval == ADT_DEFAULT_POLL_INTERVAL
     assert (
@@ -13,7 +13,9 @@ from aioresponses import aioresponses
 from pytest_mock import MockerFixture
 
 from conftest import LoginType, add_custom_response, add_logout, add_signin
+from pyadtpulse.alarm_panel import ADT_ALARM_ARMING, ADT_ALARM_OFF
 from pyadtpulse.const import (
+    ADT_ARM_DISARM_URI,
     ADT_DEFAULT_POLL_INTERVAL,
     ADT_DEVICE_URI,
     ADT_LOGIN_URI,
@@ -408,6 +410,86 @@ async def test_orb_update(
             assert p._sync_task is not None
 
 
+@pytest.mark.asyncio
+async def test_unchanged_orb_skips_update(
+    adt_pulse_instance: tuple[PyADTPulseAsync, Any],
+    get_mocked_url: Callable[..., str],
+    read_file: Callable[..., str],
+    mocker: MockerFixture,
+):
+    p, response = await adt_pulse_instance
+    update_site = mocker.spy(PyADTPulseAsync, "_update_site")
+    for orb_file in ("orb.html", "orb.html", "orb_patio_opened.html"):
+        response.get(
+            get_mocked_url(ADT_ORB_URI),
+            body=read_file(orb_file),
+            content_type="text/html",
+        )
+    assert await p.async_update()
+    assert update_site.call_count == 1
+    # identical orb, nothing to apply
+    assert await p.async_update()
+    assert update_site.call_count == 1
+    assert await p.async_update()
+    assert update_site.call_count == 2
+    assert p.site.zones_as_dict[11].state == "Open"
+    await p._cancel_task(p._timeout_task)
+
+
+@pytest.mark.asyncio
+async def test_site_zone_update_invalidates_orb_digest(
+    adt_pulse_instance: tuple[PyADTPulseAsync, Any],
+    get_mocked_url: Callable[..., str],
+    read_file: Callable[..., str],
+    mocker: MockerFixture,
+):
+    p, response = await adt_pulse_instance
+    update_site = mocker.spy(PyADTPulseAsync, "_update_site")
+    for orb_file in ("orb.html", "orb_patio_opened.html", "orb.html"):
+        response.get(
+            get_mocked_url(ADT_ORB_URI),
+            body=read_file(orb_file),
+            content_type="text/html",
+        )
+    assert await p.async_update()
+    assert update_site.call_count == 1
+    assert p.site.zones_as_dict[11].state == "OK"
+    # the site applies a different orb on its own
+    assert await p.site._async_update_zones()
+    assert p.site.zones_as_dict[11].state == "Open"
+    # same orb as the last async_update, but the site has moved on since
+    assert await p.async_update()
+    assert update_site.call_count == 2
+    assert p.site.zones_as_dict[11].state == "OK"
+    await p._cancel_task(p._timeout_task)
+
+
+@pytest.mark.asyncio
+async def test_arm_response(
+    adt_pulse_instance: tuple[PyADTPulseAsync, Any],
+    get_mocked_url: Callable[..., str],
+):
+    p, response = await adt_pulse_instance
+    alarm_panel = p.site.alarm_control_panel
+    assert alarm_panel.status == ADT_ALARM_OFF
+    response.post(
+        get_mocked_url(ADT_ARM_DISARM_URI),
+        body="<html><body><div class='p_armDisarmWrapper'><div>"
+        "Arm AnywayCancel\n\nSensors are open</div></div></body></html>",
+        content_type="text/html",
+    )
+    assert not await alarm_panel.async_arm_away(p._pulse_connection)
+    assert alarm_panel.status == ADT_ALARM_OFF
+    response.post(
+        get_mocked_url(ADT_ARM_DISARM_URI),
+        body="<html><body></body></html>",
+        content_type="text/html",
+    )
+    assert await alarm_panel.async_arm_away(p._pulse_connection)
+    assert alarm_panel.status == ADT_ALARM_ARMING
+    await p._cancel_task(p._timeout_task)
+
+
 @pytest.mark.asyncio
 async def test_keepalive_check(
     adt_pulse_instance: tuple[PyADTPulseAsync, Any],
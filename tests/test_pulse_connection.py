@@ -15,7 +15,7 @@ from pyadtpulse.exceptions import (
     PulseServerConnectionError,
 )
 from pyadtpulse.pulse_authentication_properties import PulseAuthenticationProperties
-from pyadtpulse.pulse_connection import PulseConnection
+from pyadtpulse.pulse_connection import PulseConnection, extract_seconds_from_string
 from pyadtpulse.pulse_connection_properties import PulseConnectionProperties
 from pyadtpulse.pulse_connection_status import PulseConnectionStatus
 from pyadtpulse.pulse_query_manager import MAX_REQUERY_RETRIES
@@ -220,3 +220,11 @@ async def test_only_single_login(mocked_server_responses, get_mocked_url, read_f
     await task1
     assert not pc.login_in_progress
     assert pc.is_connected
+
+
+def test_extract_seconds_from_string():
+    assert extract_seconds_from_string("Try again in 30 minutes.") == 1800
+    assert extract_seconds_from_string("Try again in 1 minute.") == 60
+    assert extract_seconds_from_string("Try again in 1 Minute.") == 60
+    assert extract_seconds_from_string("Try again in 45 seconds.") == 45
+    assert extract_seconds_from_string("Try again later.") == 0
@@ -372,3 +372,26 @@ class TestPulseConnectionProperties:
         # Assert
         with pytest.raises(RuntimeError):
             connection_properties.check_async("Async login not performed")
+
+    # make_url results are recomputed when the host or API version changes
+    def test_make_url_cache_invalidation(self):
+        # Arrange
+        connection_properties = PulseConnectionProperties(DEFAULT_API_HOST)
+        connection_properties.api_version = "26.0.0-32"
+
+        # Act
+        url = connection_properties.make_url("/summary/summary.jsp")
+
+        # Assert
+        assert url == f"{DEFAULT_API_HOST}/myhome/26.0.0-32/summary/summary.jsp"
+        assert connection_properties.make_url("/summary/summary.jsp") is url
+        connection_properties.api_version = "27.0.0-140"
+        assert (
+            connection_properties.make_url("/summary/summary.jsp")
+            == f"{DEFAULT_API_HOST}/myhome/27.0.0-140/summary/summary.jsp"
+        )
+        connection_properties.service_host = API_HOST_CA
+        assert (
+            connection_properties.make_url("/summary/summary.jsp")
+            == f"{API_HOST_CA}/myhome/27.0.0-140/summary/summary.jsp"
+        )
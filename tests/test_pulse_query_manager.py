@@ -243,8 +243,8 @@ async def run_query_exception_test(
         mock_sleep.call_count == MAX_REQUERY_RETRIES - 1
     ), f"Failure on exception {aiohttp_exception.__name__}"
     for i in range(MAX_REQUERY_RETRIES - 1):
-        assert mock_sleep.call_args_list[i][0][0] == 1 * 2 ** (
-            i
+        assert (
+            0 <= mock_sleep.call_args_list[i][0][0] <= 2**i
         ), f"Failure on exception sleep count {i} on exception {aiohttp_exception.__name__}"
     assert (
         s.get_backoff().backoff_count == 1
@@ -339,6 +339,39 @@ async def test_async_query_connector_errors(
     )
 
 
+@pytest.mark.asyncio
+async def test_async_query_recoverable_http_errors(
+    mocked_server_responses: aioresponses,
+    mock_sleep: Any,
+    get_mocked_connection_properties: PulseConnectionProperties,
+):
+    """Test transient HTTP errors are retried and others fail immediately."""
+    s = PulseConnectionStatus()
+    cp = get_mocked_connection_properties
+    p = PulseQueryManager(s, cp)
+    mocked_server_responses.get(cp.make_url(ADT_ORB_URI), status=500)
+    mocked_server_responses.get(cp.make_url(ADT_ORB_URI), status=408)
+    mocked_server_responses.get(cp.make_url(ADT_ORB_URI), status=200)
+    result = await p.async_query(ADT_ORB_URI, requires_authentication=False)
+    assert result[0] == 200
+    assert mock_sleep.call_count == 2
+    assert s.get_backoff().backoff_count == 0
+
+    for _ in range(MAX_REQUERY_RETRIES):
+        mocked_server_responses.get(cp.make_url(ADT_ORB_URI), status=502)
+    with pytest.raises(PulseServerConnectionError):
+        await p.async_query(ADT_ORB_URI, requires_authentication=False)
+    assert mock_sleep.call_count == 2 + MAX_REQUERY_RETRIES - 1
+
+    # not found isn't retried
+    s.get_backoff().reset_backoff()
+    mock_sleep.reset_mock()
+    mocked_server_responses.get(cp.make_url(ADT_ORB_URI), status=404)
+    with pytest.raises(PulseServerConnectionError):
+        await p.async_query(ADT_ORB_URI, requires_authentication=False)
+    assert mock_sleep.call_count == 0
+
+
 async def test_wait_for_authentication_flag(
     mocked_server_responses: aioresponses,
     get_mocked_connection_properties: PulseConnectionProperties,
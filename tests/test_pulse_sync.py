@@ -0,0 +1,139 @@
+"""Test synchronous PyADTPulse object."""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import pytest
+from aioresponses import aioresponses
+
+from conftest import LoginType, add_custom_response, add_logout, add_signin
+from pyadtpulse import PyADTPulse
+from pyadtpulse.const import ADT_LOGIN_URI
+from pyadtpulse.exceptions import PulseAuthenticationError
+
+
+@pytest.mark.timeout(20)
+def test_sync_login_logout(
+    mocked_server_responses: aioresponses,
+    get_mocked_url: Callable[..., str],
+    read_file: Callable[..., str],
+):
+    """Test sync login and logout."""
+    add_signin(LoginType.SUCCESS, mocked_server_responses, get_mocked_url, read_file)
+    with pytest.deprecated_call():
+        p = PyADTPulse("testuser@example.com", "testpassword", "testfingerprint")
+    assert p.loop is not None
+    assert p._session_thread is not None
+    assert p._pulse_connection_status.authenticated_flag.is_set()
+    assert p.site.name == "Robert Lippmann"
+    add_logout(mocked_server_responses, get_mocked_url, read_file)
+    add_custom_response(
+        mocked_server_responses,
+        read_file,
+        get_mocked_url(ADT_LOGIN_URI),
+        file_name=LoginType.SUCCESS.value,
+    )
+    p.logout()
+    assert not p._pulse_connection_status.authenticated_flag.is_set()
+    assert p.loop is None
+    assert p._session_thread is None
+
+
+@pytest.mark.timeout(20)
+def test_sync_login_failure(
+    mocked_server_responses: aioresponses,
+    get_mocked_url: Callable[..., str],
+    read_file: Callable[..., str],
+):
+    """Test sync login failure is raised to the caller."""
+    add_signin(LoginType.FAIL, mocked_server_responses, get_mocked_url, read_file)
+    with pytest.deprecated_call():
+        p = PyADTPulse(
+            "testuser@example.com", "testpassword", "testfingerprint", do_login=False
+        )
+    with pytest.raises(PulseAuthenticationError):
+        p.login()
+    assert p.loop is None
+    assert p._session_thread is None
+
+
+@pytest.mark.timeout(20)
+def test_sync_updates_exist(
+    mocked_server_responses: aioresponses,
+    get_mocked_url: Callable[..., str],
+    read_file: Callable[..., str],
+):
+    """Test updates_exist starts the sync check task and reads the update flag."""
+    add_signin(LoginType.SUCCESS, mocked_server_responses, get_mocked_url, read_file)
+    with pytest.deprecated_call():
+        p = PyADTPulse("testuser@example.com", "testpassword", "testfingerprint")
+    assert p._sync_task is None
+    assert p.updates_exist is False
+    for _ in range(50):
+        if p._sync_task is not None:
+            break
+        time.sleep(0.1)
+    assert p._sync_task is not None
+    p._pulse_properties.updates_exist.set()
+    assert p.updates_exist is True
+    assert p.updates_exist is False
+    add_logout(mocked_server_responses, get_mocked_url, read_file)
+    p.logout()
+    assert p._sync_task is None
+
+
+@pytest.mark.timeout(20)
+def test_sync_arm_from_running_loop(
+    mocked_server_responses: aioresponses,
+    get_mocked_url: Callable[..., str],
+    read_file: Callable[..., str],
+):
+    """Test sync arm raises instead of deadlocking inside an event loop."""
+    add_signin(LoginType.SUCCESS, mocked_server_responses, get_mocked_url, read_file)
+    with pytest.deprecated_call():
+        p = PyADTPulse("testuser@example.com", "testpassword", "testfingerprint")
+
+    async def arm_in_loop() -> bool:
+        return p.site.alarm_control_panel.arm_away(p._pulse_connection)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(arm_in_loop())
+    add_logout(mocked_server_responses, get_mocked_url, read_file)
+    p.logout()
+
+
+@pytest.mark.timeout(30)
+def test_sync_relogin_new_loop(
+    mocked_server_responses: aioresponses,
+    get_mocked_url: Callable[..., str],
+    read_file: Callable[..., str],
+):
+    """Test session events can be waited on after logging in on a new loop."""
+
+    async def wait_briefly(event: asyncio.Event) -> None:
+        try:
+            await asyncio.wait_for(event.wait(), 0.1)
+        except TimeoutError:
+            pass
+
+    add_signin(LoginType.SUCCESS, mocked_server_responses, get_mocked_url, read_file)
+    with pytest.deprecated_call():
+        p = PyADTPulse("testuser@example.com", "testpassword", "testfingerprint")
+    for _ in range(2):
+        assert p.loop is not None
+        assert p.updates_exist is False
+        # waiting binds the events to this session's loop
+        for event in (
+            p._pulse_properties.updates_exist,
+            p._pulse_connection_status.authenticated_flag,
+        ):
+            asyncio.run_coroutine_threadsafe(wait_briefly(event), p.loop).result()
+        add_logout(mocked_server_responses, get_mocked_url, read_file)
+        p.logout()
+        add_signin(
+            LoginType.SUCCESS, mocked_server_responses, get_mocked_url, read_file
+        )
+        p.login()
+    add_logout(mocked_server_responses, get_mocked_url, read_file)
+    p.logout()